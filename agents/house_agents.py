@@ -6,7 +6,7 @@ from typing import List
 
 from collections import deque
 
-from core.types import OrderRequest, OrderType, Price, Quantity, AgentId
+from core.types import OrderRequest, Price, Quantity, AgentId, _BUY, _SELL, _cents
 from core.market import MarketData
 from core.broker import AccountState
 from agents.base_agent import TradingAgent
@@ -14,6 +14,10 @@ from agents.base_agent import TradingAgent
 from config import *
 
 
+_ORDER_TYPES = (_BUY, _SELL)
+_LEVEL_SIDES = ((_BUY, -1), (_SELL, 1))
+
+
 class BadMarketMaker(TradingAgent):
     """
     Not a very good market maker
@@ -31,16 +35,17 @@ class BadMarketMaker(TradingAgent):
         Estimate fair value and make a market with that estimate
         """
 
-        best_bid = market_data.bids[0].price if market_data.bids else None
-        best_ask = market_data.asks[0].price if market_data.asks else None
+        mid_price = market_data.mid_price
 
-        if best_bid and best_ask:
-            FAIR_VALUE = (best_bid + best_ask) / 2
+        if mid_price is not None:
+            fair_value = mid_price.value
         else:
-            FAIR_VALUE = self.default_fair_value + Price(random.randint(-10, 10)/5)
+            fair_value = self.default_fair_value.value + random.randint(-10, 10)/5
 
-        return [OrderRequest(self.agent_id, OrderType.BUY, FAIR_VALUE - self.half_spread, Quantity(1)),
-                OrderRequest(self.agent_id, OrderType.SELL, FAIR_VALUE + self.half_spread, Quantity(1))]
+        half_spread = self.half_spread.value
+
+        return [OrderRequest(self.agent_id, _BUY, Price(fair_value - half_spread), Quantity(1)),
+                OrderRequest(self.agent_id, _SELL, Price(fair_value + half_spread), Quantity(1))]
 
 
 class NoiseTraderBot(TradingAgent):
@@ -60,51 +65,45 @@ class NoiseTraderBot(TradingAgent):
         On a random chance, submits an aggressive order to simulate a market trade.
         """
 
-        # Compute min and max positions
-        max_position = my_account_state.position + sum([
-            bid.quantity
-            for bid in market_data.bids if bid.agent_id == self.agent_id
-        ], start = Quantity(0))
-        min_position = my_account_state.position - sum([
-            ask.quantity
-            for ask in market_data.asks if ask.agent_id == self.agent_id
-        ], start = Quantity(0))
-
-        if random.random() < self.trade_probability:
-            # Determine what orders are actually possible
-            can_buy = len(market_data.asks) > 0
-            can_sell = len(market_data.bids) > 0
-            
-            # If only one direction is possible, do that
-            if can_buy and not can_sell:
-                order_type = OrderType.BUY
-            elif can_sell and not can_buy:
-                order_type = OrderType.SELL
-            
-            # Both are possible, choose randomly
-            elif can_buy and can_sell:
-                order_type = random.choice([OrderType.BUY, OrderType.SELL])
-            
-            # Neither is possible
-            else:
-                return []
+        if random.random() >= self.trade_probability:
+            return []
+
+        # Compute min and max positions from the broker's resting totals
+        max_position = my_account_state.position + my_account_state.resting_bids
+        min_position = my_account_state.position - my_account_state.resting_asks
 
-            if order_type == OrderType.BUY:
-                price = market_data.asks[0].price + Price(random.random())
-                quantity = min(HOUSE_POSITION_LIMIT - max_position, market_data.asks[0].quantity)
-                quantity = min(quantity, DEFAULT_MAX_ORDER_SIZE)
-                if quantity == Quantity(0):
-                    return []
-                return [OrderRequest(self.agent_id, OrderType.BUY, price, quantity)]
-            else:
-                price = market_data.bids[0].price - Price(random.random())
-                quantity = min(HOUSE_POSITION_LIMIT + min_position, market_data.bids[0].quantity)
-                quantity = min(quantity, DEFAULT_MAX_ORDER_SIZE)
-                if quantity == Quantity(0):
-                    return []
-                return [OrderRequest(self.agent_id, OrderType.SELL, price, quantity)]
+        # Determine what orders are actually possible
+        can_buy = market_data.best_ask is not None
+        can_sell = market_data.best_bid is not None
+        
+        # Both are possible, choose randomly
+        if can_buy and can_sell:
+            order_type = random.choice(_ORDER_TYPES)
+
+        # If only one direction is possible, do that
+        elif can_buy:
+            order_type = _BUY
+        elif can_sell:
+            order_type = _SELL
         
-        return []
+        # Neither is possible
+        else:
+            return []
+
+        if order_type is _BUY:
+            price = Price(market_data.best_ask.value + random.random())
+            quantity = min(HOUSE_POSITION_LIMIT - max_position, market_data.best_ask_order.quantity)
+            quantity = min(quantity, DEFAULT_MAX_ORDER_SIZE)
+            if quantity.value == 0:
+                return []
+            return [OrderRequest(self.agent_id, _BUY, price, quantity)]
+        else:
+            price = Price(market_data.best_bid.value - random.random())
+            quantity = min(HOUSE_POSITION_LIMIT + min_position, market_data.best_bid_order.quantity)
+            quantity = min(quantity, DEFAULT_MAX_ORDER_SIZE)
+            if quantity.value == 0:
+                return []
+            return [OrderRequest(self.agent_id, _SELL, price, quantity)]
 
 
 class RandomReverter(TradingAgent):
@@ -117,6 +116,7 @@ class RandomReverter(TradingAgent):
         self.is_house_agent = True
         self.fair_value = default_fair_value
         self.diff_coef = diff_coef
+        self._decay_rate = -diff_coef * math.log(2) # 2**(-diff_coef * x) == exp(_decay_rate * x)
     
     def propose_trades(self, market_data, my_account_state):
         """
@@ -124,20 +124,26 @@ class RandomReverter(TradingAgent):
         probabilities increasing with deviations
         """
 
+        best_bid = market_data.best_bid
+        best_ask = market_data.best_ask
+
         # Don't trade when insufficient orders
-        if (not market_data.bids) or (not market_data.asks):
+        if best_bid is None or best_ask is None:
             return []
         
-        mid_price = (market_data.bids[0].price + market_data.asks[0].price) / 2
+        fair_value = self.fair_value.value
+        mid_price = market_data.mid_price.value
 
-        diff = mid_price - self.fair_value
-        diff = diff if diff > Price(0) else -diff
+        # The sign test is in cents, as Price compares, so a deviation under half a cent
+        # stays negative and never trades
+        diff = mid_price - fair_value
+        diff = diff if _cents(diff) > 0 else -diff
 
-        direction = OrderType.BUY if mid_price < self.fair_value else OrderType.SELL
+        direction = _BUY if _cents(mid_price) < _cents(fair_value) else _SELL
 
         orders = []
 
-        if random.random() < (1 - 2**(-self.diff_coef * diff.value)):
+        if random.random() < (1 - math.exp(self._decay_rate * diff)):
             orders.append(OrderRequest(
                 self.agent_id,
                 direction,
@@ -145,18 +151,18 @@ class RandomReverter(TradingAgent):
                 Quantity(random.randint(1, DEFAULT_MAX_ORDER_SIZE.value))
             ))
 
-            if direction == OrderType.BUY:
+            if direction is _BUY:
                 orders.append(OrderRequest(
                     self.agent_id,
                     direction,
-                    market_data.asks[0].price,
+                    best_ask,
                     Quantity(random.randint(1, DEFAULT_MAX_ORDER_SIZE.value))
                 ))
             else: # SELL
                 orders.append(OrderRequest(
                     self.agent_id,
                     direction,
-                    market_data.bids[0].price,
+                    best_bid,
                     Quantity(random.randint(1, DEFAULT_MAX_ORDER_SIZE.value))
                 ))
 
@@ -193,8 +199,10 @@ class MysteryBot(TradingAgent):
         self.momentum_config = momentum_config
 
         self.levels = levels
+        self._depth_profiles = {}
 
         self.mid_history = deque(maxlen = 10)
+        self._mid_sum = 0.0
 
     def _maybe_switch_state(self):
         MysteryBot.switch_attempts = (MysteryBot.switch_attempts + 1) % MysteryBot.n_bots
@@ -208,30 +216,41 @@ class MysteryBot(TradingAgent):
             MysteryBot.switch_cooldown = MysteryBot.max_switch_cooldown + random.randint(0, 500)
             MysteryBot.state = "MOMENTUM" if MysteryBot.state == "REVERTING" else "REVERTING"
 
-    def compute_average_price(self, mid_price: Price) -> Price:
+    def compute_average_price(self, mid_price: float) -> float:
         """
         Assumes there are bids and asks
+
+        Takes and returns raw float prices (not Prices); mid_history holds raw floats too
         """
         
+        # _mid_sum tracks the sum of mid_history, so drop the price about to fall out
+        if len(self.mid_history) == self.mid_history.maxlen:
+            self._mid_sum -= self.mid_history[0]
+
         self.mid_history.append(mid_price)
+        self._mid_sum += mid_price
 
-        return sum(self.mid_history) / len(self.mid_history)
+        return self._mid_sum / len(self.mid_history)
 
     def _depth_profile(self):
         """
         Hmmmmmmm
         """
         
-        config = self.reverting_config if self.state == "REVERTING" else self.momentum_config
-
-        quantities = []
-        for x in self.levels:
-            c, k, s = config
-            temp = c * math.pow(x, k - 1) * math.exp(-x / s)
-            temp2 = max(1, int(round(temp * DEFAULT_MAX_ORDER_SIZE.value)))
-            
-            quantities.append(Quantity(temp2))
-        
+        # The profile only depends on the (shared) state, so compute it once per state
+        quantities = self._depth_profiles.get(self.state)
+        if quantities is not None:
+            return quantities
+
+        c, k, s = self.reverting_config if self.state == "REVERTING" else self.momentum_config
+        max_order_size = DEFAULT_MAX_ORDER_SIZE.value
+
+        quantities = [
+            Quantity(max(1, int(round(c * math.pow(x, k - 1) * math.exp(-x / s) * max_order_size))))
+            for x in self.levels
+        ]
+        self._depth_profiles[self.state] = quantities
+
         return quantities
 
     def propose_trades(self, market_data, my_account_state) -> List["OrderRequest"]:
@@ -239,34 +258,27 @@ class MysteryBot(TradingAgent):
         Hmmmmmm
         """
 
-        best_bid = market_data.bids[0].price if market_data.bids else None
-        best_ask = market_data.asks[0].price if market_data.asks else None
-
-        if best_bid and best_ask:
-            mid_price = (best_bid + best_ask) / 2
-        else:
-            mid_price = self.default_fair_value
+        mid_price = market_data.mid_price
+        mid_price = mid_price.value if mid_price is not None else self.default_fair_value.value
         
         average_price = self.compute_average_price(mid_price)
-        fast_price = sum(list(self.mid_history)[-3:]) / len(list(self.mid_history)[-3:])
+        recent_prices = list(self.mid_history)[-3:]
+        fast_price = sum(recent_prices) / len(recent_prices)
         self._maybe_switch_state()
 
         if MysteryBot.state == "MOMENTUM":
-            direction = 1 if (fast_price > average_price or random.random() < self.up_bias or mid_price < Price(30)) else -1
+            direction = 1 if (_cents(fast_price) > _cents(average_price) or random.random() < self.up_bias or _cents(mid_price) < _cents(30)) else -1
         else:
             direction = 0
         
-        mid_price += Price(direction * 0.2)
-
-        orders = []
-        depths = self._depth_profile()
-
-        for i, quantity in enumerate(depths):
-            bid_price = mid_price - Price(self.levels[i])
-            ask_price = mid_price + Price(self.levels[i])
+        mid_price += direction * 0.2
 
-            orders.append(OrderRequest(self.agent_id, OrderType.BUY, bid_price, quantity))
-            orders.append(OrderRequest(self.agent_id, OrderType.SELL, ask_price, quantity))
+        agent_id = self.agent_id
 
-        return orders
+        # A bid and an ask at every level, in level order
+        return [
+            OrderRequest(agent_id, order_type, Price(mid_price + sign * level), quantity)
+            for level, quantity in zip(self.levels, self._depth_profile())
+            for order_type, sign in _LEVEL_SIDES
+        ]
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from core.market import Trade, MarketData
-from core.types import Price, Quantity, AgentId, OrderRequest, OrderType, Order
+from core.types import Price, Quantity, AgentId, OrderRequest, Order, _BUY, _cents
 from agents.base_agent import TradingAgent
 
 import math
@@ -11,7 +11,7 @@ import math
 from config import *
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountState:
     """Holds an agent's cash and position."""
 
@@ -33,7 +33,7 @@ class RiskViolationType(Enum):
     SELF_TRADE = "self_trade"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskViolation:
     """Details about a risk control violation"""
     
@@ -119,54 +119,58 @@ class Broker:
         """
 
         account = self.accounts[request.agent_id]
+        is_buy = request.order_type is _BUY
+        quantity = request.quantity.value
+        price = request.price.value
 
         # Check order size limits
         max_size = self.max_order_sizes.get(request.agent_id, DEFAULT_MAX_ORDER_SIZE)
-        if request.quantity <= Quantity(0):
+        if quantity <= 0:
             return RiskViolation(
                 RiskViolationType.NONPOSITIVE_QUANTITY,
                 f"Order size {request.quantity} is <= 0",
                 request
             )
-        if request.quantity > max_size:
+        if quantity > max_size.value:
             return RiskViolation(
                 RiskViolationType.ORDER_SIZE_TOO_LARGE,
                 f"Order size {request.quantity} exceeds maximum {max_size}",
                 request
             )
         
-        # Check valid price
-        if not math.isfinite(request.price.value) or request.price.value < 0:
+        # Check valid price (NaN fails both comparisons, so this also rejects non-finite prices)
+        if not (0.0 <= price < math.inf):
             return RiskViolation(
                 RiskViolationType.NONPOSITIVE_PRICE,
                 f"Order price {request.price} is <= 0",
                 request
             )
 
-        # Self-trade prevention
-        if request.order_type == OrderType.BUY and market_data.asks:
-            best_ask = market_data.asks[0]
-            if request.price >= best_ask.price and best_ask.agent_id == request.agent_id:
-                return RiskViolation(
-                    RiskViolationType.SELF_TRADE,
-                    "Order would cross with own resting order.",
-                    request
-                )
-        elif request.order_type == OrderType.SELL and market_data.bids:
-            best_bid = market_data.bids[0]
-            if request.price <= best_bid.price and best_bid.agent_id == request.agent_id:
-                return RiskViolation(
-                    RiskViolationType.SELF_TRADE,
-                    "Order would cross with own resting order.",
-                    request
-                )
+        # Self-trade prevention (prices compared in cents, as Price does)
+        if is_buy:
+            best_ask = market_data.best_ask_order
+            if best_ask is not None:
+                if request.price.cents >= best_ask.price.cents and best_ask.agent_id == request.agent_id:
+                    return RiskViolation(
+                        RiskViolationType.SELF_TRADE,
+                        "Order would cross with own resting order.",
+                        request
+                    )
+        else:
+            best_bid = market_data.best_bid_order
+            if best_bid is not None:
+                if request.price.cents <= best_bid.price.cents and best_bid.agent_id == request.agent_id:
+                    return RiskViolation(
+                        RiskViolationType.SELF_TRADE,
+                        "Order would cross with own resting order.",
+                        request
+                    )
 
         # Position and cash validation logic
-        position_limit = self.position_limits.get(request.agent_id, DEFAULT_POSITION_LIMIT)
-        current_position = account.position
+        position_limit = self.position_limits.get(request.agent_id, DEFAULT_POSITION_LIMIT).value
 
-        if request.order_type == OrderType.BUY:
-            potential_position = current_position + account.resting_bids + request.quantity
+        if is_buy:
+            potential_position = account.position.value + account.resting_bids.value + quantity
             if potential_position > position_limit:
                 return RiskViolation(
                     RiskViolationType.POSITION_LIMIT_EXCEEDED,
@@ -174,8 +178,8 @@ class Broker:
                     request
                 )
             
-            required_cash = request.price * request.quantity
-            if account.cash < required_cash:
+            required_cash = price * quantity
+            if account.cash.cents < _cents(required_cash):
                 return RiskViolation(
                     RiskViolationType.INSUFFICIENT_CASH,
                     f"Insufficient cash: need ${required_cash:.2f}, have ${account.cash:.2f}",
@@ -183,7 +187,7 @@ class Broker:
                 )
                 
         else:  # SELL order
-            potential_position = current_position - account.resting_asks - request.quantity
+            potential_position = account.position.value - account.resting_asks.value - quantity
             if potential_position < -position_limit:
                 return RiskViolation(
                     RiskViolationType.POSITION_LIMIT_EXCEEDED,
@@ -201,7 +205,7 @@ class Broker:
             order: the Order to log
         """
 
-        if request.order_type == OrderType.BUY:
+        if request.order_type is _BUY:
             self.accounts[request.agent_id].resting_bids += request.quantity
         else:
             self.accounts[request.agent_id].resting_asks += request.quantity
@@ -214,7 +218,7 @@ class Broker:
             order: the Order to remove
         """
 
-        if order.order_type == OrderType.BUY:
+        if order.order_type is _BUY:
             self.accounts[order.agent_id].resting_bids -= order.quantity
         else:
             self.accounts[order.agent_id].resting_asks -= order.quantity
@@ -227,13 +231,16 @@ class Broker:
             trade: the Trade object to settle
         """
 
-        trade_value = trade.price * trade.quantity
-        
-        self.accounts[trade.buyer_id].cash -= trade_value
-        self.accounts[trade.buyer_id].position += trade.quantity
-        self.accounts[trade.buyer_id].resting_bids -= trade.quantity
-    
-        self.accounts[trade.seller_id].cash += trade_value
-        self.accounts[trade.seller_id].position -= trade.quantity
-        self.accounts[trade.seller_id].resting_asks -= trade.quantity
+        quantity = trade.quantity.value
+        trade_value = trade.price.value * quantity
+
+        buyer = self.accounts[trade.buyer_id]
+        buyer.cash = Price(buyer.cash.value - trade_value)
+        buyer.position = Quantity(buyer.position.value + quantity)
+        buyer.resting_bids = Quantity(buyer.resting_bids.value - quantity)
+
+        seller = self.accounts[trade.seller_id]
+        seller.cash = Price(seller.cash.value + trade_value)
+        seller.position = Quantity(seller.position.value - quantity)
+        seller.resting_asks = Quantity(seller.resting_asks.value - quantity)
 
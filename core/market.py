@@ -1,28 +1,99 @@
-from typing import List, Tuple, Union, Callable, Optional
+from typing import List, Tuple, Union, Callable, Optional, Iterator
 from dataclasses import dataclass
+from functools import cached_property
 import heapq
 
 from core.types import (
-    Order, OrderType, OrderRequest, Timestamp, Quantity, 
-    Price, OrderId, OrderFactory, AgentId
+    Order, OrderRequest, Timestamp, Quantity, 
+    Price, OrderFactory, AgentId, _BUY
 )
 
 
-@dataclass(frozen=True)
 class MarketData:
     """
     Read-only market data snapshot
 
+    The sorted bids and asks are only built the first time they are read, so agents
+    that only look at the top of the book don't pay for sorting it.
+
     Attributes:
         bids (Tuple[Order, ...]): A Tuple of copies of all resting bids
         asks (Tuple[Order, ...]): A Tuple of copies of all resting asks
+        best_bid (Price | None): The price of the best bid or None if there are no bids
+        best_ask (Price | None): The price of the best ask or None if there are no asks
+        best_bid_order (Order | None): The best bid or None if there are no bids
+        best_ask_order (Order | None): The best ask or None if there are no asks
+        mid_price (Price | None): The midpoint of best_bid and best_ask or None if either side is empty
     """
 
-    bids: Tuple[Order, ...]
-    asks: Tuple[Order, ...]
+    def __init__(self, bids: Tuple[Order, ...] = (), asks: Tuple[Order, ...] = (), *,
+                 _bid_entries: Optional[List[Tuple[int, int, Order]]] = None,
+                 _ask_entries: Optional[List[Tuple[int, int, Order]]] = None):
+        """
+        Creates a snapshot from sorted bids and asks.
+
+        Args:
+            bids: All resting bids in price/time priority order
+            asks: All resting asks in price/time priority order
+            _bid_entries: (INTERNAL) Keyed bid entries used instead of bids, see _from_book
+            _ask_entries: (INTERNAL) Keyed ask entries used instead of asks, see _from_book
+        """
+
+        # Key the orders the way the MatchingEngine keys its heaps
+        if _bid_entries is None:
+            _bid_entries = [(-order.price.cents, order.order_id.value, order) for order in bids]
+        if _ask_entries is None:
+            _ask_entries = [(order.price.cents, order.order_id.value, order) for order in asks]
+
+        object.__setattr__(self, "_bid_entries", _bid_entries)
+        object.__setattr__(self, "_ask_entries", _ask_entries)
+
+        # The first entries are the best orders on each side
+        best_bid_order = _bid_entries[0][-1] if _bid_entries else None
+        best_ask_order = _ask_entries[0][-1] if _ask_entries else None
+        best_bid = best_bid_order.price if best_bid_order is not None else None
+        best_ask = best_ask_order.price if best_ask_order is not None else None
+
+        object.__setattr__(self, "best_bid_order", best_bid_order)
+        object.__setattr__(self, "best_ask_order", best_ask_order)
+        object.__setattr__(self, "best_bid", best_bid)
+        object.__setattr__(self, "best_ask", best_ask)
+
+        if best_bid is not None and best_ask is not None:
+            object.__setattr__(self, "mid_price", Price((best_bid.value + best_ask.value) / 2))
+        else:
+            object.__setattr__(self, "mid_price", None)
+
+    @classmethod
+    def _from_book(cls, bid_entries: List[Tuple[int, int, Order]],
+                   ask_entries: List[Tuple[int, int, Order]]) -> "MarketData":
+        """
+        (INTERNAL) Creates a snapshot from copies of the MatchingEngine's heaps,
+        deferring the sort until bids or asks are read.
+        """
+
+        return cls(_bid_entries=bid_entries, _ask_entries=ask_entries)
+
+    # Heap keys are unique, so sorting them gives exact price/time priority order
+    @cached_property
+    def bids(self) -> Tuple[Order, ...]:
+        return tuple([entry[-1] for entry in sorted(self._bid_entries)])
 
+    @cached_property
+    def asks(self) -> Tuple[Order, ...]:
+        return tuple([entry[-1] for entry in sorted(self._ask_entries)])
 
-@dataclass(frozen=True)
+    def __setattr__(self, name, value):
+        raise AttributeError("MarketData is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("MarketData is read-only")
+
+    def __repr__(self):
+        return f"MarketData(bids={self.bids!r}, asks={self.asks!r})"
+
+
+@dataclass(eq=False, slots=True) # Not frozen since frozen __init__ is much slower, but should never be mutated
 class Trade:
     """Represents a single executed trade with all relevant details."""
     
@@ -40,9 +111,10 @@ class MatchingEngine:
     Uses price/time priority matching algorithm
 
     Attributes:
-        bids (List[Order]): A list of buy orders, sorted by price/time
-        asks (List[Order]): A list of sell orders, sorted by price/time
-        trade_log (List[str]): A log of all trades that have occurred
+        bids (List[Tuple[int, int, Order]]): A heap of buy orders keyed by (-price in cents, order id)
+        asks (List[Tuple[int, int, Order]]): A heap of sell orders keyed by (price in cents, order id)
+        trade_log (List[Trade]): A log of all trades that have occurred
+        last_trade_price (Price | None): The price of the most recent trade or None if there are no trades
     """
 
     def __init__(self, on_trade_callback: Callable[[Trade], None] = lambda x: None):
@@ -53,13 +125,19 @@ class MatchingEngine:
             on_trade_callback: An optional function to call whenever a trade occurs.
         """
         
-        self.bids: List[Tuple[Price, Timestamp, OrderId, Order]] = []
-        self.asks: List[Tuple[Price, Timestamp, OrderId, Order]] = []
-        self.trade_log: List[str] = []
+        self.bids: List[Tuple[int, int, Order]] = []
+        self.asks: List[Tuple[int, int, Order]] = []
+        self.trade_log: List[Trade] = []
         self._order_factory = OrderFactory()
         self._next_trade_id = 1
         self.on_trade_callback = on_trade_callback
 
+    @property
+    def last_trade_price(self) -> Price | None:
+        """The price of the most recent trade or None if there are no trades"""
+
+        return self.trade_log[-1].price if self.trade_log else None
+
     def get_market_data(self) -> MarketData:
         """
         Creates a read-only snapshot of the current market state.
@@ -71,16 +149,8 @@ class MatchingEngine:
             A MarketData object containing the data currently in this MatchingEngine
         """
 
-        return MarketData(
-            bids = tuple(sorted(
-                [bid[-1] for bid in self.bids],
-                key = lambda o: (-o.price, o.timestamp)
-            )),
-            asks = tuple(sorted(
-                [ask[-1] for ask in self.asks],
-                key = lambda o: (o.price, o.timestamp)
-            ))
-        )
+        # Copy the heaps so the snapshot doesn't change as orders are processed
+        return MarketData._from_book(list(self.bids), list(self.asks))
 
     def prune_book(self, current_timestamp: Timestamp, max_age: int) -> List[Order]:
         """
@@ -94,28 +164,24 @@ class MatchingEngine:
             List of all pruned Orders
         """
 
-        def helper(book_side: List[Tuple[Price, Timestamp, OrderId, Order]]):
-            pruned_side = []
-            removed_orders = []
+        cutoff = current_timestamp.value - max_age
+        removed_orders = []
 
+        for book_side in (self.bids, self.asks):
+            # Compact the surviving orders to the front of the list in place
+            kept = 0
             for order_tuple in book_side:
-                order = order_tuple[-1]
-                if current_timestamp.value - order.timestamp.value < max_age:
-                    pruned_side.append(order_tuple)
+                if order_tuple[-1].timestamp.value > cutoff:
+                    book_side[kept] = order_tuple
+                    kept += 1
                 else:
-                    removed_orders.append(order)
-            
-            return removed_orders, pruned_side
-
-        all_removed_orders, self.bids = helper(self.bids)
-        temp, self.asks = helper(self.asks)
+                    removed_orders.append(order_tuple[-1])
 
-        all_removed_orders += temp
+            if kept < len(book_side):
+                del book_side[kept:]
+                heapq.heapify(book_side)
 
-        heapq.heapify(self.bids)
-        heapq.heapify(self.asks)
-
-        return all_removed_orders
+        return removed_orders
 
     def process_order(self, request: OrderRequest, timestamp: Timestamp) -> Order:
         """
@@ -138,7 +204,8 @@ class MatchingEngine:
     def _match_order(self, incoming_order: Order) -> None:
         """
         (INTERNAL) Attempts to match an incoming order with existing orders in the order
-        book, then updates the order book
+        book, then updates the order book. Each trade is reported as soon as the resting
+        order it filled has been updated
 
         Args:
             incoming_order: The new Order to update the book with
@@ -147,61 +214,61 @@ class MatchingEngine:
             None
         """
 
-        if incoming_order.order_type == OrderType.BUY:
+        is_buy = incoming_order.order_type is _BUY
+        if is_buy:
             book_to_add = self.bids
             book_to_match = self.asks
         else: # SELL
             book_to_add = self.asks
             book_to_match = self.bids
 
-        trades_made = []
-        while incoming_order.quantity.value > 0 and len(book_to_match) > 0:
-            resting_order_tuple = book_to_match[0]
-            resting_order = resting_order_tuple[-1]
+        # Resting keys are signed cents, so a resting order crosses when its key <= limit_key
+        limit_key = incoming_order.price.cents if is_buy else -incoming_order.price.cents
 
-            can_match = (
-                (incoming_order.order_type == OrderType.BUY and incoming_order.price >= resting_order.price) or
-                (incoming_order.order_type == OrderType.SELL and incoming_order.price <= resting_order.price)
-            )
-            
-            if not can_match:
-                break
+        incoming_quantity = incoming_order.quantity.value
+        filled = False
+        while incoming_quantity > 0 and book_to_match:
+            resting_key, _, resting_order = book_to_match[0]
 
-            heapq.heappop(book_to_match)
+            if resting_key > limit_key:
+                break
 
-            trade_quantity = min(incoming_order.quantity, resting_order.quantity)
+            resting_quantity = resting_order.quantity.value
+            trade_quantity = incoming_quantity if incoming_quantity < resting_quantity else resting_quantity
             trade_price = resting_order.price
 
-            trade = self._create_trade_object(trade_quantity, trade_price, incoming_order, resting_order)
-            trades_made.append(trade)
+            trade = self._create_trade_object(Quantity(trade_quantity), trade_price, incoming_order, resting_order)
+
+            incoming_quantity -= trade_quantity
+            resting_order.quantity = Quantity(resting_quantity - trade_quantity)
+            filled = True
 
-            incoming_order.quantity -= trade_quantity
-            resting_order.quantity -= trade_quantity
+            # A partial fill doesn't change the resting order's key, so it stays in place
+            if resting_quantity == trade_quantity:
+                heapq.heappop(book_to_match)
+
+            self._report_trade(trade)
 
-            if resting_order.quantity.value > 0:
-                heapq.heappush(book_to_match, resting_order_tuple)
+        if filled:
+            incoming_order.quantity = Quantity(incoming_quantity)
 
         # Add remaining quantity to the book if any
-        if incoming_order.quantity.value > 0:
-            incoming_order_tuple = (
-                incoming_order.price * (-1 if incoming_order.order_type == OrderType.BUY else 1),
-                incoming_order.timestamp,
-                incoming_order.order_id,
-                incoming_order
-            )
+        if incoming_quantity > 0:
+            # -limit_key is this side's signed key. Order ids increase with time, so they
+            # also break price ties by time
+            incoming_order_tuple = (-limit_key, incoming_order.order_id.value, incoming_order)
 
             heapq.heappush(book_to_add, incoming_order_tuple)
-        
-        for trade in trades_made:
-            self._report_trade(trade)
 
     def _create_trade_object(self, quantity: Quantity, price: Price, incoming_order: Order, resting_order: Order) -> Trade:
         """(INTERNAL) Creates a structured Trade object from a match event."""
 
         now = incoming_order.timestamp
         
-        buyer_id = incoming_order.agent_id if incoming_order.order_type == OrderType.BUY else resting_order.agent_id
-        seller_id = incoming_order.agent_id if incoming_order.order_type == OrderType.SELL else resting_order.agent_id
+        if incoming_order.order_type is _BUY:
+            buyer_id, seller_id = incoming_order.agent_id, resting_order.agent_id
+        else:
+            buyer_id, seller_id = resting_order.agent_id, incoming_order.agent_id
         
         trade = Trade(
             trade_id=self._next_trade_id,
@@ -215,10 +282,27 @@ class MatchingEngine:
 
         return trade
 
+    def formatted_log(self) -> Iterator[str]:
+        """
+        Formats the trade log into descriptive entries, one per trade.
+
+        Args:
+            None
+
+        Returns:
+            An iterator over the formatted log entries, oldest first
+        """
+
+        for trade in self.trade_log:
+            yield (
+                f"[{trade.timestamp}] TRADE: {trade.quantity} units at ${trade.price:.2f} "
+                f"(Buyer: {trade.buyer_id}, Seller: {trade.seller_id})"
+            )
+
     def _report_trade(self, trade: Trade) -> None:
         """
-        (INTERNAL) Creates a structured Trade, reports it for settlement, and
-        stores a descriptive log entry.
+        (INTERNAL) Reports a structured Trade for settlement and stores it in the
+        trade log. Log entries are only formatted on demand by formatted_log.
         
         Args:
             trade: The finalized Trade object to report.
@@ -226,10 +310,5 @@ class MatchingEngine:
         
         self.on_trade_callback(trade)
 
-        log_entry = (
-            f"[{trade.timestamp}] TRADE: {trade.quantity} units at ${trade.price:.2f} "
-            f"(Buyer: {trade.buyer_id}, Seller: {trade.seller_id})"
-        )
-
-        self.trade_log.append(log_entry)
+        self.trade_log.append(trade)
 
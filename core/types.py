@@ -3,7 +3,13 @@ from enum import Enum
 from typing import Self
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+def _cents(value: int | float) -> int:
+    """(INTERNAL) Rounds a raw price to cents, the resolution Prices are compared at"""
+
+    return int(round(value * 100))
+
+
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class _NumericValue:
     """
     An internal base class for creating typesafe numeric value objects.
@@ -11,8 +17,11 @@ class _NumericValue:
 
     value: int | float
 
+    # Each comparison tries an exact type match first, which is a single pointer
+    # compare, before falling back to the isinstance checks
+
     def __eq__(self, other):
-        if isinstance(other, self.__class__): return self.value == other.value
+        if type(other) is type(self) or isinstance(other, self.__class__): return self.value == other.value
         if isinstance(other, (int, float)): return self.value == other
         return NotImplemented
 
@@ -21,19 +30,22 @@ class _NumericValue:
         return not result if result is not NotImplemented else NotImplemented
 
     def __lt__(self, other):
-        if isinstance(other, self.__class__): return self.value < other.value
+        if type(other) is type(self) or isinstance(other, self.__class__): return self.value < other.value
         if isinstance(other, (int, float)): return self.value < other
         return NotImplemented
 
     def __le__(self, other):
+        if type(other) is type(self): return self.value <= other.value
         if isinstance(other, (self.__class__, int, float)): return self.__lt__(other) or self.__eq__(other)
         return NotImplemented
 
     def __gt__(self, other):
+        if type(other) is type(self): return self.value > other.value
         if isinstance(other, (self.__class__, int, float)): return not self.__le__(other)
         return NotImplemented
 
     def __ge__(self, other):
+        if type(other) is type(self): return self.value >= other.value
         if isinstance(other, (self.__class__, int, float)): return not self.__lt__(other)
         return NotImplemented
 
@@ -76,7 +88,7 @@ class _NumericValue:
     def __sub__(self, other) -> Self | None : self._unsupported_op("-")
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class OrderId(_NumericValue):
     """(int) Unique ID for an Order"""
 
@@ -86,7 +98,7 @@ class OrderId(_NumericValue):
         if not isinstance(self.value, int): raise TypeError("OrderId must be an integer.")
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class AgentId(_NumericValue):
     """(int) Unique ID for an Agent"""
 
@@ -96,7 +108,7 @@ class AgentId(_NumericValue):
         if not isinstance(self.value, int): raise TypeError("AgentId must be an integer.")
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class Price(_NumericValue):
     """(float) Price for an Order"""
 
@@ -104,17 +116,30 @@ class Price(_NumericValue):
     cents: int = field(init=False)
 
     def __post_init__(self):
-        if not isinstance(self.value, (int, float)): raise TypeError("Price must be a number.")
-        object.__setattr__(self, "cents", int(round(self.value * 100)))
+        # Checked only in debug mode (the default) since Prices are created on every order
+        if __debug__ and not isinstance(self.value, (int, float)): raise TypeError("Price must be a number.")
+        object.__setattr__(self, "cents", _cents(self.value))
 
     def __eq__(self, other):
-        if isinstance(other, Price): return self.cents == other.cents
+        if type(other) is Price or isinstance(other, Price): return self.cents == other.cents
         return NotImplemented
     
     def __lt__(self, other):
-        if isinstance(other, Price): return self.cents < other.cents
+        if type(other) is Price or isinstance(other, Price): return self.cents < other.cents
         return NotImplemented
 
+    def __le__(self, other):
+        if type(other) is Price: return self.cents <= other.cents
+        return _NumericValue.__le__(self, other)
+
+    def __gt__(self, other):
+        if type(other) is Price: return self.cents > other.cents
+        return _NumericValue.__gt__(self, other)
+
+    def __ge__(self, other):
+        if type(other) is Price: return self.cents >= other.cents
+        return _NumericValue.__ge__(self, other)
+
     def __add__(self, other):
         if isinstance(other, Price): return Price(self.value + other.value)
         self._unsupported_op("+")
@@ -139,14 +164,15 @@ class Price(_NumericValue):
     def __neg__(self): return Price(-self.value)
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class Quantity(_NumericValue):
     """(int) Number of shares for an Order"""
 
     value: int
 
     def __post_init__(self):
-        if not isinstance(self.value, int): raise TypeError("Quantity must be an integer.")
+        # Checked only in debug mode (the default) since Quantities are created on every fill
+        if __debug__ and not isinstance(self.value, int): raise TypeError("Quantity must be an integer.")
     
     def __add__(self, other):
         if isinstance(other, Quantity): return Quantity(self.value + other.value)
@@ -174,7 +200,13 @@ class OrderType(Enum):
     SELL = -1
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+# Enum member lookups go through the Enum metaclass, so the hot paths compare
+# against these aliases instead
+_BUY = OrderType.BUY
+_SELL = OrderType.SELL
+
+
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class OrderRequest:
     """
     A single order request created by an Agent
@@ -192,7 +224,7 @@ class OrderRequest:
     quantity: Quantity
 
 
-@dataclass(init=True, repr=False, eq=False, order=False, frozen=True)
+@dataclass(init=True, repr=False, eq=False, order=False, frozen=True, slots=True)
 class Timestamp(_NumericValue):
     """(int) A discrete time tick from the simulation's virtual clock"""
 
@@ -205,7 +237,7 @@ class Timestamp(_NumericValue):
             raise ValueError("Timestamp cannot be negative.")
 
 
-@dataclass # Mutable for more performant partial filling
+@dataclass(slots=True) # Mutable for more performant partial filling
 class Order:
     """
     A single order for use by the internal engine.
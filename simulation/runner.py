@@ -1,8 +1,11 @@
+import io
 import random
-from typing import List, Callable
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Callable, Dict, Iterable, Any
 
 from core.market import MatchingEngine
-from core.types import Timestamp
+from core.types import Timestamp, Price
 from core.broker import Broker
 
 from agents.base_agent import TradingAgent
@@ -10,6 +13,34 @@ from agents.base_agent import TradingAgent
 from config import *
 
 
+def _run_one(agent_factory: Callable[[], List[TradingAgent]], seed: int, num_ticks: int) -> Dict[str, Any]:
+    """
+    (INTERNAL) Runs a single headless simulation for Runner.run_sweep
+
+    Args:
+        agent_factory: A function returning a fresh list of TradingAgents
+        seed: The seed for the simulation
+        num_ticks: The number of ticks to run
+
+    Returns:
+        A summary dict of the simulation results
+    """
+
+    # Agents draw from the global random module, which worker processes don't
+    # seed independently
+    random.seed(seed)
+
+    runner = Runner(agent_factory(), seed)
+    runner.run(num_ticks, verbose=False)
+
+    return {
+        "seed": seed,
+        "num_trades": len(runner.engine.trade_log),
+        "last_trade_price": runner.engine.last_trade_price,
+        "accounts": runner.broker.accounts
+    }
+
+
 class Runner:
     """
     Manages the core logic and execution of a market simulation.
@@ -35,7 +66,17 @@ class Runner:
         self.virtual_clock = 0
         self.on_tick_callback = on_tick_callback
 
-    def _run_tick(self, verbose: bool = True, prune_age: int = DEFAULT_PRUNE_AGE) -> None:
+    def _announce(self, tick: int) -> None:
+        """
+        (INTERNAL) Prints the banner for a tick in place of the previous banner
+
+        Args:
+            tick: The (0-indexed) tick to announce
+        """
+
+        print(f"\r--- Tick {tick + 1} ---", end="")
+
+    def _run_tick(self, verbose: bool = True, prune_age: int = DEFAULT_PRUNE_AGE, announce_every: int = 1) -> None:
         """
         (INTERNAL) Runs a single tick of the simulation
 
@@ -43,6 +84,7 @@ class Runner:
             verbose: Whether to always announce the tick
             prune_age: The max age (in ticks) an Order can be before
                        being discarded or -1 to keep all Orders
+            announce_every: Only announce every announce_every-th tick when verbose
             debug_callback: Optional callback for debugging/logging
         
         Returns:
@@ -51,8 +93,8 @@ class Runner:
 
         current_timestamp = Timestamp(self.virtual_clock)
 
-        if verbose:
-            print(f"\r--- Tick {self.virtual_clock + 1} ---", end="")
+        if verbose and self.virtual_clock % announce_every == 0:
+            self._announce(self.virtual_clock)
 
         if prune_age > 0 and self.virtual_clock > 0:
             pruned_orders = self.engine.prune_book(current_timestamp, max_age=prune_age)
@@ -63,23 +105,30 @@ class Runner:
         self.rng.shuffle(self.agents)
         market_data = self.engine.get_market_data()
 
+        # Bound once per tick rather than looked up for every agent and request
+        get_account_state = self.broker.get_account_state
+        validate_order = self.broker.validate_order
+        log_order = self.broker.log_order
+        process_order = self.engine.process_order
+
         for agent in self.agents:
-            account_state = self.broker.get_account_state(agent.agent_id)
+            agent_id = agent.agent_id
+            account_state = get_account_state(agent_id)
 
             # Check registered with broker
             if not account_state:
-                raise Exception(f"Agent with id {agent.agent_id} isn't registered with the broker.")
+                raise Exception(f"Agent with id {agent_id} isn't registered with the broker.")
             
             # Get OrderRequests from agent
             requests = agent.propose_trades(market_data, account_state)
 
             # Skip all OrderRequests if mismatched agent_id
-            if sum([agent.agent_id != request.agent_id for request in requests]) != 0:
+            if any(agent_id != request.agent_id for request in requests):
                 continue
 
             # Process all OrderRequests
             for request in requests:
-                risk_violation = self.broker.validate_order(request, market_data)
+                risk_violation = validate_order(request, market_data)
 
                 # Skip request if risk_violation
                 if risk_violation:
@@ -87,9 +136,9 @@ class Runner:
                         print(f"\nRisk violation for Agent {request.agent_id}: {risk_violation.message}")
                 else:
                     # Send request to engine
-                    order = self.engine.process_order(request, current_timestamp)
+                    order = process_order(request, current_timestamp)
 
-                    self.broker.log_order(request)
+                    log_order(request)
         
         if self.on_tick_callback:
             self.on_tick_callback(market_data, self.broker.accounts)
@@ -108,17 +157,53 @@ class Runner:
 
         if verbose:
             print(f"--- Starting Simulation (Running for {num_ticks} ticks) ---")
+
+        # Writing the tick banner every tick costs more than many ticks do
+        announce_every = max(1, num_ticks // 500)
         
         for tick in range(num_ticks):
             self.virtual_clock = tick
-            self._run_tick(verbose)
+            self._run_tick(verbose, announce_every=announce_every)
 
         if not verbose:
             return
 
+        # Make sure the last tick is always announced
+        if num_ticks > 0 and (num_ticks - 1) % announce_every != 0:
+            self._announce(num_ticks - 1)
+
         print("\n\n--- Simulation Complete ---")
         self.print_summary()
 
+    @staticmethod
+    def run_sweep(agent_factory: Callable[[], List[TradingAgent]], seeds: Iterable[int], num_ticks: int,
+                  max_workers: int | None = None) -> List[Dict[str, Any]]:
+        """
+        Runs one independent, headless simulation per seed in parallel worker processes.
+
+        Every simulation gets a fresh worker process, which makes the pool use the
+        "spawn" start method. Workers re-import agent_factory by name, so it must be
+        defined in an importable module (not in a notebook cell), and scripts must
+        call run_sweep under an `if __name__ == "__main__":` guard.
+
+        Args:
+            agent_factory: A function importable from a module, returning a fresh list
+                           of TradingAgents, called once per simulation
+            seeds: The seeds to run, one simulation each
+            num_ticks: The number of ticks to run each simulation for
+            max_workers: The max number of worker processes or None for one per CPU
+        
+        Returns:
+            One summary dict per seed, in the same order as seeds, with the seed,
+            num_trades, last_trade_price and the final accounts
+        """
+
+        # Some house agents keep class-level state, so give every simulation a fresh process
+        with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as executor:
+            futures = [executor.submit(_run_one, agent_factory, seed, num_ticks) for seed in seeds]
+
+            return [future.result() for future in futures]
+
     def print_summary(self) -> None:
         """
         Prints a summary of the simulation results.
@@ -132,31 +217,39 @@ class Runner:
 
         market_data = self.engine.get_market_data()
 
-        print("\n--- Final Simulation Summary ---")
-        print(f"Total Trades Executed: {len(self.engine.trade_log)}")
+        # Build the whole report and write it once instead of once per line
+        out = io.StringIO()
+
+        print("\n--- Final Simulation Summary ---", file=out)
+        print(f"Total Trades Executed: {len(self.engine.trade_log)}", file=out)
         
-        print("\n--- Final Order Book State ---")
-        print(f"# Bids (Buy Orders): {len(market_data.bids)}")
-        print("Top 10 Bids:")
+        print("\n--- Final Order Book State ---", file=out)
+        print(f"# Bids (Buy Orders): {len(market_data.bids)}", file=out)
+        print("Top 10 Bids:", file=out)
         for order in market_data.bids[:10]:
-            print(f"  > {order.quantity} @ ${order.price:.2f} (Agent: {order.agent_id})")
+            print(f"  > {order.quantity} @ ${order.price:.2f} (Agent: {order.agent_id})", file=out)
 
-        print(f"\n# Asks (Sell Orders): {len(self.engine.asks)}")
-        print("Top 10 Asks:")
+        print(f"\n# Asks (Sell Orders): {len(self.engine.asks)}", file=out)
+        print("Top 10 Asks:", file=out)
         for order in market_data.asks[:10]:
-            print(f"  > {order.quantity} @ ${order.price:.2f} (Agent: {order.agent_id})")
+            print(f"  > {order.quantity} @ ${order.price:.2f} (Agent: {order.agent_id})", file=out)
         
-        print("\n--- Final Account States ---")
-        mid_price = Price(float(self.engine.trade_log[-1].split("$")[1].split(" ")[0]))
+        print("\n--- Final Account States ---", file=out)
+        mid_price = market_data.mid_price
+
+        if mid_price is None:
+            mid_price = self.engine.last_trade_price
+
+        # No book or trades to value positions with
+        if mid_price is None:
+            mid_price = Price(0)
 
-        if self.engine.bids and self.engine.asks:
-            mid_price = (market_data.bids[0].price + market_data.asks[0].price)/2
+        # Value each account once, for both sorting and printing
+        valued_accounts = [(state.cash + state.position * mid_price, state) for state in self.broker.accounts.values()]
+        valued_accounts.sort(key=lambda x: x[0], reverse=True)
 
-        sorted_accounts = sorted(
-            self.broker.accounts.values(), 
-            key=lambda x: x.cash + x.position * mid_price,
-            reverse=True
-        )
-        for state in sorted_accounts:
-            print(f"  > Agent {state.agent_id.value}:\t Est. Value ${state.cash + state.position * mid_price :,.2f},\t Cash ${state.cash:,.2f},\t Position: {state.position}")
+        for est_value, state in valued_accounts:
+            print(f"  > Agent {state.agent_id.value}:\t Est. Value ${est_value :,.2f},\t Cash ${state.cash:,.2f},\t Position: {state.position}", file=out)
 
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
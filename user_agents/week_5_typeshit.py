@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 from config import DEFAULT_MAX_ORDER_SIZE
 
+_HALF_SPREAD = 1.99999
+_ORDER_SIZE = Quantity(10)
+
 
 class SimpleMarketMaker(TradingAgent):
     """
@@ -27,13 +30,10 @@ class SimpleMarketMaker(TradingAgent):
         Estimate fair value and make a market with that estimate
         """
 
-        best_bid = market_data.bids[0].price if market_data.bids else None
-        best_ask = market_data.asks[0].price if market_data.asks else None
-
-        FAIR_VALUE = self.default_fair_value
+        FAIR_VALUE = self.default_fair_value.value
 
-        if best_bid and best_ask:
-            FAIR_VALUE = (best_bid + best_ask) / 2
+        if market_data.mid_price is not None:
+            FAIR_VALUE = market_data.mid_price.value
         
         # if best_bid:
         #     half_spread_bid = best_bid + FAIR_VALUE
@@ -63,5 +63,6 @@ class SimpleMarketMaker(TradingAgent):
         # order_quantity= Quantity(min(abs(order_quantity.value),10))
 
 
-        return [OrderRequest(self.agent_id, OrderType.BUY, FAIR_VALUE - Price(1.99999), Quantity(10)),
-                OrderRequest(self.agent_id, OrderType.SELL, FAIR_VALUE + Price(1.99999), Quantity(10))]
+        # Raw values are only wrapped once, for the OrderRequests
+        return [OrderRequest(self.agent_id, OrderType.BUY, Price(FAIR_VALUE - _HALF_SPREAD), _ORDER_SIZE),
+                OrderRequest(self.agent_id, OrderType.SELL, Price(FAIR_VALUE + _HALF_SPREAD), _ORDER_SIZE)]
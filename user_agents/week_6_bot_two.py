@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from collections import deque
 from typing import List, Tuple, TYPE_CHECKING
 
 from core.types import OrderRequest, OrderType, Price, Quantity, AgentId
@@ -11,6 +12,8 @@ from config import *
 if TYPE_CHECKING:
     from core.broker import AccountState
 
+_DEFAULT_SPREAD = Price(1)
+
 # class BabyBot(TradingAgent):
 #     """
 #     An agent that simulates sma
@@ -78,7 +81,7 @@ class ToddlerBot(TradingAgent):
         super().__init__(agent_id)
         self.default_fair_value = default_fair_value
         self.window = window
-        self.past_prices = []
+        self.past_prices = deque(maxlen = window)
 
     def propose_trades(self, market_data: MarketData, acc_state: "AccountState") -> List[OrderRequest]:
         """
@@ -92,38 +95,38 @@ class ToddlerBot(TradingAgent):
         position_ratio = acc_state.position.value / DEFAULT_POSITION_LIMIT.value
         buy_bias = max(0, 1.0 - position_ratio)
         sell_bias = max(0, 1.0 + position_ratio)
-        buy_qty = min(Quantity(int(DEFAULT_MAX_ORDER_SIZE.value * buy_bias)), DEFAULT_MAX_ORDER_SIZE)
-        sell_qty = min(Quantity(int(DEFAULT_MAX_ORDER_SIZE.value * sell_bias)), DEFAULT_MAX_ORDER_SIZE)
+        max_order_size = DEFAULT_MAX_ORDER_SIZE.value
+        buy_qty = min(int(max_order_size * buy_bias), max_order_size)
+        sell_qty = min(int(max_order_size * sell_bias), max_order_size)
         
-        # propose trades
+        # propose trades (raw values are only wrapped once, for the OrderRequests)
+        # A saturated side has nothing to quote, and a zero quantity order would just be rejected
         trades = []
-        trades.append(OrderRequest(self.agent_id, OrderType.BUY, sma - spread, buy_qty))
-        trades.append(OrderRequest(self.agent_id, OrderType.SELL, sma + spread, sell_qty))
+        if buy_qty > 0:
+            trades.append(OrderRequest(self.agent_id, OrderType.BUY, Price(sma.value - spread.value), Quantity(buy_qty)))
+        if sell_qty > 0:
+            trades.append(OrderRequest(self.agent_id, OrderType.SELL, Price(sma.value + spread.value), Quantity(sell_qty)))
 
         return trades
     
     def compute_fair_price(self, market_data: MarketData) -> Price:
-        best_bid = market_data.bids[0].price if market_data.bids else None
-        best_ask = market_data.asks[0].price if market_data.asks else None
-
-        if best_bid and best_ask:
-            FAIR_VALUE = (best_bid + best_ask) / 2
+        if market_data.mid_price is not None:
+            FAIR_VALUE = market_data.mid_price
         else:
             FAIR_VALUE = self.default_fair_value
         
+        # The bounded deque drops the oldest price itself
         self.past_prices.append(FAIR_VALUE)
-        if len(self.past_prices) > 10:
-            self.past_prices.pop(0)
         
         sma = sum(self.past_prices) / len(self.past_prices)
         
         return sma
     
     def compute_fair_spread(self, market_data: MarketData, mid_price: Price) -> Price:
-        spread = Price(1)
+        spread = _DEFAULT_SPREAD
 
-        if market_data.bids and market_data.asks:
-            half_spread = max(market_data.asks[0].price - mid_price, mid_price - market_data.bids[0].price)
+        if market_data.best_bid is not None and market_data.best_ask is not None:
+            half_spread = max(market_data.best_ask - mid_price, mid_price - market_data.best_bid)
             if half_spread.value > 0:
                 spread = half_spread
 